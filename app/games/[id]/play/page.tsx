@@ -40,6 +40,8 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
 
   const [apiBaseUrl, setApiBaseUrl] = useState("https://kinefast.onrender.com")
   const [connectionStatus, setConnectionStatus] = useState<"connected" | "disconnected" | "connecting">("connecting")
+  // Session events arrive over the WebSocket, then SSE, and only fall back to polling ui-sync-status
+  const [liveFeed, setLiveFeed] = useState<"websocket" | "sse" | "polling" | null>(null)
   const [retryCount, setRetryCount] = useState(0)
   const maxRetries = 3
 
@@ -57,6 +59,10 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
   const pollCountRef = useRef(0)
   const connectionIntervalRef = useRef<NodeJS.Timeout | null>(null)
   const scoreIntervalRef = useRef<NodeJS.Timeout | null>(null)
+  const liveFeedRef = useRef<"websocket" | "sse" | "polling" | null>(null)
+  const processSyncDataRef = useRef<(data: any, source: string) => void>(() => {})
+  const fetchAllScoresRef = useRef<() => Promise<any>>(async () => null)
+  const startPollingRef = useRef<() => void>(() => {})
 
   // Keep refs in sync with state
   useEffect(() => {
@@ -122,69 +128,9 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
     addDebugMessage("All API requests stopped. Game completed.")
   }, [stopPolling, addDebugMessage])
 
-  // Function to poll for UI sync status
-  // pollSyncStatus fonksiyonunu önce tanımlayalım
-  const pollSyncStatus = useCallback(async () => {
-    // Mock mod açıksa, API çağrısı yapmayalım
-    if (mockMode) {
-      console.log("Mock mod açık. API çağrısı atlanıyor.")
-      return
-    }
-    try {
-      // Tüm öğrenciler tamamlandıysa polling'i durduralım
-      if (completedStudents.size === studentsRef.current.length && studentsRef.current.length > 0) {
-        console.log("Tüm öğrenciler tamamlandı. Tüm API isteklerini durduruyoruz.")
-        stopAllApiRequests()
-        return
-      }
-      // Update poll count
-      setPollCount((prev) => prev + 1)
-      setLastPollTime(Date.now())
-
-      if (!isPolling) {
-        console.log("Polling is disabled, skipping poll")
-        return
-      }
-
-      // Prevent concurrent requests
-      if (requestInProgressRef.current) {
-        console.log("Sync request already in progress, skipping")
-        return
-      }
-
-      requestInProgressRef.current = true
-      console.log(`Poll #${pollCountRef.current + 1}: Fetching UI sync status`)
-
-      // Use AbortController to timeout long requests
-      const controller = new AbortController()
-      const timeoutId = setTimeout(() => controller.abort(), 3000) // 3 second timeout
-
-      const res = await fetch(`${apiBaseUrl}/gamesession/ui-sync-status`, {
-        headers: {
-          "Cache-Control": "no-cache",
-          Pragma: "no-cache",
-        },
-        signal: controller.signal,
-      })
-
-      clearTimeout(timeoutId)
-
-      if (!res.ok) {
-        const errorText = await res.text()
-        console.log(`Poll #${pollCountRef.current}: API error: ${res.status} - ${errorText}`)
-        throw new Error(`Server responded with ${res.status}: ${errorText}`)
-      }
-
-      const data = await res.json()
-      console.log(`Poll #${pollCountRef.current}: Received sync data: ${JSON.stringify(data)}`)
-      setSyncStatus(data)
-
-      // Check if we have valid data
-      if (!data || Object.keys(data).length === 0) {
-        console.log(`Poll #${pollCountRef.current}: No sync data available`)
-        return
-      }
-
+  // Applies one ui-sync-status payload or pushed session event to the scores and the active student
+  const processSyncData = useCallback(
+    (data: any, source: string) => {
       // Normalize data types - ensure student_id is number
       const studentId =
         typeof data.student_id === "string" ? Number.parseInt(data.student_id, 10) : Number(data.student_id)
@@ -195,7 +141,7 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
         if (studentIndex !== -1) {
           // Her zaman güncelle, aynı olsa bile - bu, Unity'den gelen bilgiyi önceliklendirir
           console.log(
-            `Poll #${pollCountRef.current}: Setting currentIndex to ${studentIndex} for active student ${studentId}`,
+            `${source}: Setting currentIndex to ${studentIndex} for active student ${studentId}`,
           )
           setCurrentIndex(studentIndex)
           currentIndexRef.current = studentIndex
@@ -203,7 +149,7 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
           // Eğer tüm öğrenciler tamamlandıysa, bu aktif öğrenciyi lastCompletedStudent olarak da ayarla
           if (completedStudents.size === studentsRef.current.length && lastCompletedStudent === null) {
             console.log(
-              `Poll #${pollCountRef.current}: All students completed. Setting lastCompletedStudent to active student ${studentId}`,
+              `${source}: All students completed. Setting lastCompletedStudent to active student ${studentId}`,
             )
             setLastCompletedStudent(studentId)
           }
@@ -215,19 +161,18 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
       const score = typeof data.score === "string" ? Number.parseInt(data.score, 10) : Number(data.score)
 
       console.log(
-        `Poll #${pollCountRef.current}: Normalized data - completed: ${completed}, studentId: ${studentId}, score: ${score}`,
+        `${source}: Normalized data - completed: ${completed}, studentId: ${studentId}, score: ${score}`,
       )
 
       // Geri kalan kod aynı...
       if (completed && studentId && score !== null && score !== undefined) {
         // Eğer bu öğrenci zaten tamamlanmış olarak işaretlenmişse, tekrar işlem yapma
         if (completedStudents.has(studentId)) {
-          console.log(`Poll #${pollCountRef.current}: Student ${studentId} already marked as completed. Skipping.`)
-          requestInProgressRef.current = false
+          console.log(`${source}: Student ${studentId} already marked as completed. Skipping.`)
           return
         }
 
-        console.log(`Poll #${pollCountRef.current}: Found completed game for student ${studentId} with score ${score}`)
+        console.log(`${source}: Found completed game for student ${studentId} with score ${score}`)
 
         // Always update the score, even if it's the same
         setScores((prev) => {
@@ -235,7 +180,7 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
             ...prev,
             [studentId]: score,
           }
-          console.log(`Poll #${pollCountRef.current}: Updated scores: ${JSON.stringify(newScores)}`)
+          console.log(`${source}: Updated scores: ${JSON.stringify(newScores)}`)
 
           // Skor güncellendiğinde, bir sonraki aktif öğrenciyi belirle
           setTimeout(() => {
@@ -245,7 +190,7 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
             // Tüm öğrenciler tamamlandıysa, son tamamlanan öğrenciyi göster
             if (completedStudents.size + 1 >= studentsRef.current.length) {
               console.log(
-                `Poll #${pollCountRef.current}: All students completed. Setting currentIndex to last completed student.`,
+                `${source}: All students completed. Setting currentIndex to last completed student.`,
               )
               setCurrentIndex(completedIndex)
               currentIndexRef.current = completedIndex
@@ -265,7 +210,7 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
               }
 
               if (loopCount < studentsRef.current.length) {
-                console.log(`Poll #${pollCountRef.current}: Setting currentIndex to next active student: ${nextIndex}`)
+                console.log(`${source}: Setting currentIndex to next active student: ${nextIndex}`)
                 setCurrentIndex(nextIndex)
                 currentIndexRef.current = nextIndex
               }
@@ -280,18 +225,18 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
           const newSet = new Set(prev)
           newSet.add(studentId)
           console.log(
-            `Poll #${pollCountRef.current}: Added student ${studentId} to completed students. Total: ${newSet.size}`,
+            `${source}: Added student ${studentId} to completed students. Total: ${newSet.size}`,
           )
           return newSet
         })
 
         // Set the last completed student
-        console.log(`Poll #${pollCountRef.current}: Setting lastCompletedStudent to ${studentId}`)
+        console.log(`${source}: Setting lastCompletedStudent to ${studentId}`)
         setLastCompletedStudent(studentId)
 
         // Find the index of this student in our array
         const completedIndex = studentsRef.current.findIndex((s) => s.id === studentId)
-        console.log(`Poll #${pollCountRef.current}: Student index in array: ${completedIndex}`)
+        console.log(`${source}: Student index in array: ${completedIndex}`)
 
         if (completedIndex !== -1) {
           // Calculate the next student index
@@ -312,19 +257,18 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
           // If we've checked all students and they're all completed, don't move to next student
           if (loopCount >= studentsRef.current.length || completedStudentsArray.length >= studentsRef.current.length) {
             console.log(
-              `Poll #${pollCountRef.current}: All students have completed their games. Not moving to next student.`,
+              `${source}: All students have completed their games. Not moving to next student.`,
             )
-            requestInProgressRef.current = false
             return // Exit the function early
           }
 
           console.log(
-            `Poll #${pollCountRef.current}: Next student index would be: ${nextIndex}, current index is: ${currentIndexRef.current}`,
+            `${source}: Next student index would be: ${nextIndex}, current index is: ${currentIndexRef.current}`,
           )
 
           // IMMEDIATELY update the current index to show the correct student as playing
           if (currentIndexRef.current !== nextIndex) {
-            console.log(`Poll #${pollCountRef.current}: Setting currentIndex to ${nextIndex}`)
+            console.log(`${source}: Setting currentIndex to ${nextIndex}`)
             setCurrentIndex(nextIndex)
             currentIndexRef.current = nextIndex // Manually update the ref to avoid stale values
           }
@@ -336,7 +280,7 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
             // Eğer bu öğrenci zaten tamamlanmışsa, bir sonraki öğrenciye geç
             if (completedStudents.has(nextStudentId)) {
               console.log(
-                `Poll #${pollCountRef.current}: Student ${nextStudentId} already completed. Finding next student.`,
+                `${source}: Student ${nextStudentId} already completed. Finding next student.`,
               )
 
               // Bir sonraki öğrenciye geç - handleNextStudent fonksiyonunu çağırmak yerine doğrudan mantığı uygula
@@ -359,28 +303,96 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
                 completedStudentsArray.length >= completedStudents.length
               ) {
                 console.log(
-                  `Poll #${pollCountRef.current}: All students have completed their games. Not moving to next student.`,
+                  `${source}: All students have completed their games. Not moving to next student.`,
                 )
                 return // Exit the function early
               }
 
-              console.log(`Poll #${pollCountRef.current}: Moving to next student at index ${nextStudentIndex}`)
+              console.log(`${source}: Moving to next student at index ${nextStudentIndex}`)
               setCurrentIndex(nextStudentIndex)
               currentIndexRef.current = nextStudentIndex
 
               const nextId = studentsRef.current[nextStudentIndex].id
-              console.log(`Poll #${pollCountRef.current}: Sending start signal for next student: ${nextId}`)
+              console.log(`${source}: Sending start signal for next student: ${nextId}`)
               sendStartSignal(nextId)
               return
             }
 
-            console.log(`Poll #${pollCountRef.current}: Sending start signal for next student: ${nextStudentId}`)
+            console.log(`${source}: Sending start signal for next student: ${nextStudentId}`)
             sendStartSignal(nextStudentId)
           }, 500)
         }
       } else {
-        console.log(`Poll #${pollCountRef.current}: No completed game found in sync data`)
+        console.log(`${source}: No completed game found in sync data`)
       }
+    },
+    [completedStudents, lastCompletedStudent],
+  )
+
+  // Function to poll for UI sync status
+  // pollSyncStatus fonksiyonunu önce tanımlayalım
+  const pollSyncStatus = useCallback(async () => {
+    // Mock mod açıksa, API çağrısı yapmayalım
+    if (mockMode) {
+      console.log("Mock mod açık. API çağrısı atlanıyor.")
+      return
+    }
+    try {
+      // Tüm öğrenciler tamamlandıysa polling'i durduralım
+      if (completedStudents.size === studentsRef.current.length && studentsRef.current.length > 0) {
+        console.log("Tüm öğrenciler tamamlandı. Tüm API isteklerini durduruyoruz.")
+        stopAllApiRequests()
+        return
+      }
+      // Update poll count
+      setPollCount((prev) => prev + 1)
+      setLastPollTime(Date.now())
+
+      if (!isPolling) {
+        console.log("Polling is disabled, skipping poll")
+        return
+      }
+
+      // Prevent concurrent requests
+      if (requestInProgressRef.current) {
+        console.log("Sync request already in progress, skipping")
+        return
+      }
+
+      requestInProgressRef.current = true
+      console.log(`Poll #${pollCountRef.current + 1}: Fetching UI sync status`)
+
+      // Use AbortController to timeout long requests
+      const controller = new AbortController()
+      const timeoutId = setTimeout(() => controller.abort(), 3000) // 3 second timeout
+
+      const res = await fetch(`${apiBaseUrl}/gamesession/ui-sync-status`, {
+        headers: {
+          "Cache-Control": "no-cache",
+          Pragma: "no-cache",
+        },
+        signal: controller.signal,
+      })
+
+      clearTimeout(timeoutId)
+
+      if (!res.ok) {
+        const errorText = await res.text()
+        console.log(`Poll #${pollCountRef.current}: API error: ${res.status} - ${errorText}`)
+        throw new Error(`Server responded with ${res.status}: ${errorText}`)
+      }
+
+      const data = await res.json()
+      console.log(`Poll #${pollCountRef.current}: Received sync data: ${JSON.stringify(data)}`)
+      setSyncStatus(data)
+
+      // Check if we have valid data
+      if (!data || Object.keys(data).length === 0) {
+        console.log(`Poll #${pollCountRef.current}: No sync data available`)
+        return
+      }
+
+      processSyncData(data, `Poll #${pollCountRef.current}`)
     } catch (err) {
       const errorMessage = err instanceof Error ? err.message : String(err)
       console.log(`Poll #${pollCountRef.current}: Error: ${errorMessage}`)
@@ -401,10 +413,16 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
     } finally {
       requestInProgressRef.current = false
     }
-  }, [isPolling, completedStudents, lastCompletedStudent, apiBaseUrl, mockMode, stopAllApiRequests, stopPolling])
+  }, [isPolling, completedStudents, apiBaseUrl, mockMode, stopAllApiRequests, stopPolling, processSyncData])
 
   // Start/stop polling
   const startPolling = useCallback(() => {
+    // WebSocket/SSE zaten açıksa polling'e gerek yok
+    if (liveFeedRef.current === "websocket" || liveFeedRef.current === "sse") {
+      addDebugMessage(`Live feed (${liveFeedRef.current}) active, not starting polling`)
+      return
+    }
+
     if (pollingIntervalRef.current) {
       clearInterval(pollingIntervalRef.current)
       pollingIntervalRef.current = null
@@ -931,6 +949,11 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
       console.log("Oyun tamamlandı. Bağlantı kontrolü atlanıyor.")
       return true
     }
+    // Açık bir WebSocket/SSE bağlantısı zaten sunucuya ulaşıldığını gösteriyor
+    if (liveFeedRef.current === "websocket" || liveFeedRef.current === "sse") {
+      setConnectionStatus("connected")
+      return true
+    }
     try {
       setConnectionStatus("connecting")
       // HEAD yerine GET metodu kullanıyoruz
@@ -1117,6 +1140,114 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
     }
   }, [checkConnection, gameCompleted])
 
+  // Keep the latest handlers reachable from the long-lived socket callbacks
+  useEffect(() => {
+    processSyncDataRef.current = processSyncData
+    fetchAllScoresRef.current = fetchAllScores
+    startPollingRef.current = startPolling
+  }, [processSyncData, fetchAllScores, startPolling])
+
+  // Canlı oturum olayları: önce WebSocket, engellenirse SSE, o da olmazsa ui-sync-status polling
+  useEffect(() => {
+    if (!gameId || mockMode || gameCompleted) return
+
+    let closed = false
+    let socket: WebSocket | null = null
+    let source: EventSource | null = null
+    let reconnectTimer: NodeJS.Timeout | null = null
+
+    const switchFeed = (feed: "websocket" | "sse" | "polling") => {
+      liveFeedRef.current = feed
+      setLiveFeed(feed)
+      addDebugMessage(`Live feed: ${feed}`)
+      if (feed === "polling") {
+        startPollingRef.current()
+      } else {
+        stopPolling()
+        setConnectionStatus("connected")
+      }
+    }
+
+    const handleEvent = (event: any, label: string) => {
+      if (event.type === "reset") {
+        // The server no longer buffers the events we missed; reload the scoreboard
+        fetchAllScoresRef.current()
+        return
+      }
+      if (selectedIds.length > 0 && !selectedIds.includes(Number(event.student_id))) return
+      setSyncStatus(event)
+      processSyncDataRef.current(event, `${label} #${event.id}`)
+    }
+
+    const connectSse = () => {
+      if (closed || typeof EventSource === "undefined") {
+        if (!closed) switchFeed("polling")
+        return
+      }
+      const params = new URLSearchParams({ game_id: String(gameId) })
+      if (selectedIds.length > 0) params.set("student_ids", selectedIds.join(","))
+      const stream = new EventSource(`${apiBaseUrl}/gamesession/stream?${params}`)
+      source = stream
+      stream.onopen = () => {
+        switchFeed("sse")
+        fetchAllScoresRef.current()
+      }
+      for (const type of ["started", "score", "completed", "reset"]) {
+        stream.addEventListener(type, (message) => handleEvent(JSON.parse((message as MessageEvent).data), "SSE"))
+      }
+      stream.onerror = () => {
+        // EventSource reconnects by itself (with Last-Event-ID); only a closed stream needs the fallback
+        if (stream.readyState === EventSource.CLOSED && !closed) {
+          source = null
+          switchFeed("polling")
+        }
+      }
+    }
+
+    const connectWebSocket = () => {
+      if (closed) return
+      if (typeof WebSocket === "undefined") {
+        connectSse()
+        return
+      }
+      let opened = false
+      const ws = new WebSocket(`${apiBaseUrl.replace(/^http/, "ws")}/ws/gamesession/${gameId}`)
+      socket = ws
+      ws.onopen = () => {
+        opened = true
+        switchFeed("websocket")
+        // Events published before the socket opened are not replayed; catch up from all-scores
+        fetchAllScoresRef.current()
+      }
+      ws.onmessage = (message) => handleEvent(JSON.parse(message.data), "WS")
+      ws.onclose = () => {
+        socket = null
+        if (closed) return
+        if (!opened) {
+          addDebugMessage("WebSocket unavailable, falling back to SSE")
+          connectSse()
+          return
+        }
+        // Sunucu yavaş istemciyi kapatabilir; kısa bir beklemeden sonra yeniden bağlan
+        addDebugMessage("WebSocket closed, reconnecting")
+        liveFeedRef.current = null
+        reconnectTimer = setTimeout(connectWebSocket, 3000)
+      }
+    }
+
+    connectWebSocket()
+
+    return () => {
+      closed = true
+      if (reconnectTimer) clearTimeout(reconnectTimer)
+      socket?.close()
+      source?.close()
+      liveFeedRef.current = null
+    }
+    // selectedIds is rebuilt on every render; the joined string is the stable dependency
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [apiBaseUrl, gameId, mockMode, gameCompleted, selectedIds.join(","), addDebugMessage, stopPolling])
+
   // Temizleme işlemlerini yapmak için component unmount olduğunda çalışacak bir useEffect ekleyelim
   useEffect(() => {
     // Component unmount olduğunda tüm interval'ları temizle
@@ -1604,6 +1735,7 @@ export default function GamePlayPage({ params }: { params: { id: string } }) {
                 completedStudents: Array.from(completedStudents),
                 apiBaseUrl,
                 connectionStatus,
+                liveFeed,
                 retryCount,
                 maxRetries,
                 mockMode,
@@ -0,0 +1,112 @@
+"""
+Cold-start benchmark for api.py.
+
+Measures, in fresh interpreter processes:
+  - import:          wall time of `import api`
+  - first_response:  time from launching uvicorn until the first successful response
+
+Each metric is the median over --runs. The run fails (exit code 1) when a metric exceeds its
+absolute limit or regresses by more than --tolerance against a saved baseline.
+
+    python benchmarks/cold_start.py                       # measure and check limits
+    python benchmarks/cold_start.py --save-baseline       # record benchmarks/cold_start.json
+    python benchmarks/cold_start.py --baseline benchmarks/cold_start.json
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "cold_start.json")
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import api; print(time.perf_counter() - t)"
+
+
+def measure_import() -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_first_response(path: str, timeout: float) -> float:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}{path}"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status < 500:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError, OSError):
+                time.sleep(0.01)
+        raise TimeoutError(f"No response from {url} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/admin/db-writer", help="endpoint used for the first request")
+    parser.add_argument("--max-import", type=float, default=float(os.getenv("COLD_START_MAX_IMPORT", "2.0")))
+    parser.add_argument("--max-first-response", type=float,
+                        default=float(os.getenv("COLD_START_MAX_FIRST_RESPONSE", "5.0")))
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, help="write results as the new baseline")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    first_responses = [measure_first_response(args.path, args.max_first_response * 4) for _ in range(args.runs)]
+    results = {
+        "import": round(statistics.median(imports), 4),
+        "first_response": round(statistics.median(first_responses), 4),
+    }
+    print(json.dumps(results, indent=2))
+
+    failures = []
+    limits = {"import": args.max_import, "first_response": args.max_first_response}
+    for metric, limit in limits.items():
+        if results[metric] > limit:
+            failures.append(f"{metric} {results[metric]:.3f}s exceeds limit {limit:.3f}s")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for metric, value in results.items():
+            if metric in baseline and value > baseline[metric] * (1 + args.tolerance):
+                failures.append(f"{metric} {value:.3f}s regressed past baseline {baseline[metric]:.3f}s (+{args.tolerance:.0%})")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
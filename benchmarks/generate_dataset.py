@@ -0,0 +1,235 @@
+"""
+Synthetic school dataset for load and performance testing.
+
+Builds a fresh SQLite database with the full KineDB schema (benchmarks/schema.sql) and fills
+it with N schools, their teachers, classes and students, a game catalog with GameImpacts
+rules, SuggestedActionTemplates and a history of past gameplays. Output is deterministic for
+a given --seed, so runs against the same parameters are comparable.
+
+    python benchmarks/generate_dataset.py --out bench.db --schools 5 --students-per-class 30
+    DATABASE_URL=sqlite:///./bench.db uvicorn api:app
+
+Use scripts/sqlite_to_postgres.py to copy the generated database into Postgres.
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(ROOT, "benchmarks", "schema.sql")
+
+SUBJECTS = [
+    "Math", "English", "Science", "Design", "Education", "Human", "History", "Art",
+    "Music", "Biology", "Geography", "Engineering", "Algorithm", "Social",
+]
+STRENGTHS = [
+    "Problem Solving", "Creativity", "Focus", "Teamwork", "Memory", "Logical Thinking",
+    "Communication", "Persistence", "Spatial Reasoning", "Curiosity",
+]
+DEVELOPMENT_AREAS = [
+    "Attention Span", "Reading Fluency", "Arithmetic Speed", "Fine Motor Skills", "Listening",
+    "Time Management", "Vocabulary", "Self Regulation", "Pattern Recognition", "Collaboration",
+]
+FIRST_NAMES = ["Ada", "Ali", "Can", "Deniz", "Elif", "Emir", "Ece", "Kerem", "Lara", "Mert", "Nil", "Zeynep"]
+LAST_NAMES = ["Aydin", "Demir", "Kaya", "Celik", "Sahin", "Yildiz", "Ozturk", "Arslan", "Dogan", "Koc"]
+GRADES = ["1", "2", "3", "4", "5", "6"]
+
+
+def insert_rows(conn: sqlite3.Connection, table: str, columns: list, rows: list):
+    if rows:
+        placeholders = ", ".join("?" for _ in columns)
+        conn.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+
+
+def person(r: random.Random) -> tuple:
+    return r.choice(FIRST_NAMES), r.choice(LAST_NAMES)
+
+
+def generate(
+    out: str,
+    schools: int = 3,
+    classes_per_school: int = 4,
+    students_per_class: int = 25,
+    games: int = 40,
+    skills: int = 120,
+    boosts: int = 8,
+    templates: int = 200,
+    skills_per_student: int = 20,
+    plays_per_student: int = 30,
+    seed: int = 0,
+) -> dict:
+    """Creates `out` (replacing any existing file) and returns the row counts per table."""
+    r = random.Random(seed)
+    now = datetime(2025, 1, 1)
+    if os.path.exists(out):
+        os.remove(out)
+
+    conn = sqlite3.connect(out)
+    with open(SCHEMA_PATH) as f:
+        conn.executescript(f.read())
+
+    insert_rows(conn, "Subjects", ["name", "description", "grade_level", "curriculum_area"],
+                [(name, f"{name} curriculum", "all", name) for name in SUBJECTS])
+    skill_names = [f"{r.choice(SUBJECTS)} skill {i}" for i in range(1, skills + 1)]
+    insert_rows(conn, "Skills", ["name", "description", "subject_id", "level"],
+                [(name, name, r.randint(1, len(SUBJECTS)), r.choice(["basic", "intermediate", "advanced"]))
+                 for name in skill_names])
+    insert_rows(conn, "Strengths", ["name", "description", "category"],
+                [(name, name, "general") for name in STRENGTHS])
+    insert_rows(conn, "DevelopmentAreas", ["name", "description", "category"],
+                [(name, name, "general") for name in DEVELOPMENT_AREAS])
+
+    # Game catalog and the impact rules applied when a game ends
+    game_names = [f"Game {i}" for i in range(1, games + 1)]
+    insert_rows(conn, "Games", ["game_name", "subject", "level", "description", "status", "creator", "last_updated",
+                                "plays", "avg_score", "avg_time", "difficulty_level", "age_range", "time_limit",
+                                "points_per_question"],
+                [(name, r.choice(SUBJECTS), r.choice(["easy", "medium", "hard"]), f"{name} description", "active",
+                  "generator", now.isoformat(sep=" "), 0, 0, "10 min", r.randint(1, 5), "6-12", 600, 10)
+                 for name in game_names])
+    insert_rows(conn, "GameSkills", ["game_id", "skill"],
+                [(game_id, skill) for game_id in range(1, games + 1) for skill in r.sample(skill_names, min(5, skills))])
+    insert_rows(conn, "GameImpacts", ["game_name", "main_subject", "subjects_boost", "skills_boost", "add_strengths",
+                                      "add_areas_on_low_score", "recommendations", "difficulty_level"],
+                [(name,
+                  r.choice(SUBJECTS),
+                  json.dumps({s: r.randint(-5, 10) for s in r.sample(SUBJECTS, min(boosts, len(SUBJECTS)))}),
+                  json.dumps({s: r.randint(-10, 15) for s in r.sample(skill_names, min(boosts, skills))}),
+                  json.dumps([str(i) for i in r.sample(range(1, len(STRENGTHS) + 1), 2)]),
+                  json.dumps(r.sample(range(1, len(DEVELOPMENT_AREAS) + 1), 2)),
+                  json.dumps(r.sample(game_names, min(3, games))),
+                  r.choice(["easy", "medium", "hard"]))
+                 for name in game_names])
+
+    template_rows = []
+    for i in range(templates):
+        if r.random() < 0.6:
+            condition = f"skill:{r.choice(skill_names)}<{r.randint(30, 70)}"
+        else:
+            condition = f"game:{r.choice(game_names)}<{r.randint(40, 80)}"
+        target = f"game:{r.choice(game_names)}>{r.randint(50, 90)}" if r.random() < 0.7 else None
+        template_rows.append((r.choice(["short_term", "long_term"]), f"Goal {i + 1}", condition, target))
+    insert_rows(conn, "SuggestedActionTemplates", ["type", "goal", "condition", "target_condition"], template_rows)
+
+    # Schools, one teacher per class, students
+    user_id = 0
+    class_id = 0
+    student_id = 0
+    users, teachers, class_rows, recent_games, students = [], [], [], [], []
+    student_skills, subject_scores, strengths, areas, plays, performances, perf_scores = [], [], [], [], [], [], []
+    for school_id in range(1, schools + 1):
+        for _ in range(classes_per_school):
+            class_id += 1
+            user_id += 1
+            first, last = person(r)
+            users.append((f"teacher{user_id}", f"teacher{user_id}@school{school_id}.example", "x", "teacher",
+                          first, last, "active", school_id))
+            teachers.append((f"T{user_id}", first, last, f"teacher{user_id}@school{school_id}.example", "active",
+                             school_id, user_id))
+            class_rows.append((f"Class {class_id}", r.choice(GRADES), "", "Mon-Fri", f"Room {class_id}", "active",
+                               user_id, school_id, now.isoformat(sep=" "), students_per_class))
+            for game in r.sample(game_names, min(3, games)):
+                recent_games.append((class_id, game, (now - timedelta(days=r.randint(0, 30))).isoformat(sep=" "),
+                                     round(r.uniform(40, 95), 1)))
+
+            for _ in range(students_per_class):
+                student_id += 1
+                user_id += 1
+                first, last = person(r)
+                users.append((f"student{student_id}", f"student{student_id}@school{school_id}.example", "x", "student",
+                              first, last, "active", school_id))
+                scores = [r.randint(20, 100) for _ in range(plays_per_student)]
+                students.append((student_id, f"S{student_id:06d}", f"{first} {last}", r.choice(GRADES), "active",
+                                 (now - timedelta(days=r.randint(30, 400))).date().isoformat(),
+                                 round(sum(scores) / len(scores), 2) if scores else 0, "12 min",
+                                 now.isoformat(sep=" "), "On Track", class_id, plays_per_student, user_id, school_id,
+                                 f"{first} {last}"))
+                student_skills.extend((student_id, skill, r.randint(0, 100), 0)
+                                      for skill in r.sample(skill_names, min(skills_per_student, skills)))
+                subject_scores.extend((student_id, subject, float(r.randint(30, 95)))
+                                      for subject in r.sample(SUBJECTS, 5))
+                strengths.extend((student_id, sid, 1) for sid in r.sample(range(1, len(STRENGTHS) + 1), 2))
+                areas.extend((student_id, aid, 1) for aid in r.sample(range(1, len(DEVELOPMENT_AREAS) + 1), 2))
+                for score in scores:
+                    game_id = r.randint(1, games)
+                    played_at = (now - timedelta(minutes=r.randint(0, 60 * 24 * 180))).isoformat(sep=" ")
+                    plays.append((game_id, student_id, float(score), played_at))
+                    performances.append((student_id, game_id, played_at, float(score), r.randint(60, 900), "completed"))
+                perf_scores.append((student_id, *[float(r.randint(30, 95)) for _ in range(15)]))
+
+    insert_rows(conn, "Users", ["username", "email", "password", "role", "first_name", "last_name", "status",
+                                "school_id"], users)
+    insert_rows(conn, "Schools", ["school_name", "city", "state", "status"],
+                [(f"School {i}", "Istanbul", "TR", "active") for i in range(1, schools + 1)])
+    insert_rows(conn, "Teachers", ["teacher_id", "first_name", "last_name", "email", "status", "school_id", "user_id"],
+                teachers)
+    insert_rows(conn, "Classes", ["class_name", "grade_level", "description", "schedule", "location", "status",
+                                  "teacher_id", "school_id", "last_active", "students"], class_rows)
+    insert_rows(conn, "ClassRecentGames", ["class_id", "game_name", "game_date", "avg_score"], recent_games)
+    insert_rows(conn, "Students", ["student_internal_id", "student_external_id", "name", "grade", "status",
+                                   "join_date", "avg_score", "avg_time_per_session", "last_active", "progress_status",
+                                   "class_id", "games_played", "user_id", "school_id", "teacher"], students)
+    insert_rows(conn, "StudentSkills", ["student_id", "skill", "score", "is_strength"], student_skills)
+    insert_rows(conn, "StudentSubjectScores", ["student_id", "subject", "score"], subject_scores)
+    insert_rows(conn, "StudentStrengths", ["student_id", "strength_id", "level"], strengths)
+    insert_rows(conn, "StudentDevelopmentAreas", ["student_id", "area_id", "priority"], areas)
+    insert_rows(conn, "GamePlays", ["game_id", "student_id", "score", "played_at"], plays)
+    insert_rows(conn, "StudentGamePerformances", ["student_id", "game_id", "play_date", "score", "duration",
+                                                  "completion_status"], performances)
+    insert_rows(conn, "performance_scores", ["student_id", "math_score", "english_score", "science_score",
+                                             "design_score", "education_score", "human_score", "history_score",
+                                             "art_score", "music_score", "biology_score", "geography_score",
+                                             "engineering_score", "algorithm_score", "social_score", "general_score"],
+                perf_scores)
+    conn.execute(
+        "UPDATE Games SET plays = (SELECT COUNT(*) FROM GamePlays WHERE GamePlays.game_id = Games.game_id), "
+        "avg_score = COALESCE((SELECT ROUND(AVG(score), 2) FROM GamePlays WHERE GamePlays.game_id = Games.game_id), 0)"
+    )
+    conn.commit()
+
+    tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' "
+                                             "AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+    counts = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables}
+    conn.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=os.path.join(ROOT, "bench.db"))
+    parser.add_argument("--schools", type=int, default=3)
+    parser.add_argument("--classes-per-school", type=int, default=4)
+    parser.add_argument("--students-per-class", type=int, default=25)
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--skills", type=int, default=120)
+    parser.add_argument("--boosts", type=int, default=8, help="subject/skill boosts per GameImpacts rule")
+    parser.add_argument("--templates", type=int, default=200, help="SuggestedActionTemplates rows")
+    parser.add_argument("--skills-per-student", type=int, default=20)
+    parser.add_argument("--plays-per-student", type=int, default=30, help="historical GamePlays per student")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    counts = generate(
+        args.out,
+        schools=args.schools,
+        classes_per_school=args.classes_per_school,
+        students_per_class=args.students_per_class,
+        games=args.games,
+        skills=args.skills,
+        boosts=args.boosts,
+        templates=args.templates,
+        skills_per_student=args.skills_per_student,
+        plays_per_student=args.plays_per_student,
+        seed=args.seed,
+    )
+    for table, count in counts.items():
+        if count:
+            print(f"{table}: {count}")
+    print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
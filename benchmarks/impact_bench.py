@@ -0,0 +1,201 @@
+"""
+Microbenchmarks for apply_game_impacts and session completion.
+
+Every scenario gets its own database from generate_dataset.py and runs in a fresh
+interpreter (api.py binds DATABASE_URL at import). Two operations are measured per scenario:
+
+  apply_game_impacts  apply one play of a random game for a random student (rule cache warm)
+  end_session         POST /gamesession/{id}/end handler for a started session; the impact
+                      job is only enqueued, as in production
+
+Reported per operation: median and p95 wall time, queries per call and peak traced memory
+per call (tracemalloc, measured in a separate pass so it does not skew the timings). The run
+fails (exit code 1) when a metric regresses against a saved baseline: times and memory by
+more than --tolerance, query counts by any increase.
+
+    python benchmarks/impact_bench.py                          # all scenarios
+    python benchmarks/impact_bench.py --scenario boosts_50 --iterations 200
+    python benchmarks/impact_bench.py --save-baseline          # record benchmarks/impact_bench.json
+    python benchmarks/impact_bench.py --baseline benchmarks/impact_bench.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "impact_bench.json")
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+BASE = {"schools": 1, "classes_per_school": 2, "students_per_class": 25, "games": 40, "plays_per_student": 30}
+SCENARIOS = {
+    "boosts_5": {**BASE, "boosts": 5, "skills": 120, "skills_per_student": 20, "templates": 50},
+    "boosts_50": {**BASE, "boosts": 50, "skills": 120, "skills_per_student": 20, "templates": 50},
+    "long_skill_lists": {**BASE, "boosts": 8, "skills": 600, "skills_per_student": 400, "templates": 50},
+    "many_templates": {**BASE, "boosts": 8, "skills": 120, "skills_per_student": 20, "templates": 800},
+    "large": {**BASE, "boosts": 50, "skills": 600, "skills_per_student": 400, "templates": 800},
+}
+
+
+def percentile(samples: list, q: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, max(0, int(round(q / 100 * len(samples))) - 1))]
+
+
+def summarize(durations: list, queries: list, peaks: list) -> dict:
+    return {
+        "median_ms": round(statistics.median(durations) * 1000, 3),
+        "p95_ms": round(percentile(durations, 95) * 1000, 3),
+        "queries": round(statistics.median(queries), 1),
+        "peak_kib": round(statistics.median(peaks) / 1024, 1),
+    }
+
+
+async def measure(operation, iterations: int, QueryStats, current_query_stats) -> dict:
+    """Runs `operation(i)` iterations times for timings and query counts, then again under tracemalloc."""
+    durations, queries = [], []
+    for i in range(iterations):
+        stats = QueryStats("bench")
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await operation(i)
+        finally:
+            durations.append(time.perf_counter() - started)
+            current_query_stats.reset(token)
+        queries.append(stats.count)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(iterations, iterations * 2):
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await operation(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return summarize(durations, queries, peaks)
+
+
+async def run_worker(iterations: int, seed: int) -> dict:
+    sys.path.insert(0, ROOT)
+    import api
+
+    await api.database.connect()
+    await api.apply_storage_profile()
+    await api.ensure_indexes()
+    await api.impact_rules.load()
+    # Creates ImpactJobs; workers are stopped again so end_session only measures the request path
+    await api.impact_queue.start()
+    await api.impact_queue.stop()
+
+    rng = random.Random(seed)
+    students = [row[0] for row in await api.database.fetch_all("SELECT student_internal_id FROM Students")]
+    games = [(row[0], row[1]) for row in await api.database.fetch_all("SELECT game_id, game_name FROM Games")]
+
+    async def apply_one(_):
+        _, game_name = rng.choice(games)
+        await api.apply_game_impacts(rng.choice(students), game_name, rng.randint(20, 100))
+
+    sessions = []
+    for _ in range(iterations * 2):
+        game_id, _ = rng.choice(games)
+        session_id = await api.database.execute(
+            "INSERT INTO game_sessions (student_id, game_id, completed, is_started, created_at, user_id) "
+            "VALUES (:sid, :gid, 0, 1, CURRENT_TIMESTAMP, 1)",
+            {"sid": rng.choice(students), "gid": game_id},
+        )
+        sessions.append((session_id, game_id))
+
+    async def end_one(i):
+        session_id, game_id = sessions[i]
+        await api.end_game_session(session_id, {"result_score": rng.randint(20, 100), "game_id": game_id})
+
+    results = {
+        "apply_game_impacts": await measure(apply_one, iterations, api.QueryStats, api.current_query_stats),
+        "end_session": await measure(end_one, iterations, api.QueryStats, api.current_query_stats),
+    }
+    await api.database.disconnect()
+    return results
+
+
+def run_scenario(name: str, iterations: int, seed: int) -> dict:
+    from generate_dataset import generate
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        generate(db_path, seed=seed, **SCENARIOS[name])
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}"}
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", "--iterations", str(iterations), "--seed", str(seed)],
+            cwd=ROOT, env=env, capture_output=True, text=True,
+        )
+        if out.returncode != 0:
+            raise RuntimeError(f"Scenario {name} failed:\n{out.stderr}")
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    failures = []
+    for scenario, operations in results.items():
+        for operation, metrics in operations.items():
+            base = baseline.get(scenario, {}).get(operation)
+            if not base:
+                continue
+            for metric in ("median_ms", "p95_ms", "peak_kib"):
+                if metric in base and metrics[metric] > base[metric] * (1 + tolerance):
+                    failures.append(f"{scenario}/{operation} {metric} {metrics[metric]} regressed past "
+                                    f"baseline {base[metric]} (+{tolerance:.0%})")
+            if "queries" in base and metrics["queries"] > base["queries"]:
+                failures.append(f"{scenario}/{operation} queries {metrics['queries']} > baseline {base['queries']}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default all)")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, help="write results as the new baseline")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(asyncio.run(run_worker(args.iterations, args.seed))))
+        return
+
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        results[name] = run_scenario(name, args.iterations, args.seed)
+        for operation, metrics in results[name].items():
+            print(f"{name:<18} {operation:<20} median {metrics['median_ms']:>8} ms  p95 {metrics['p95_ms']:>8} ms  "
+                  f"queries {metrics['queries']:>5}  peak {metrics['peak_kib']:>8} KiB")
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(results, json.load(f), args.tolerance)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
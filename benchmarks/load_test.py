@@ -0,0 +1,191 @@
+"""
+Classroom load harness for api.py.
+
+Replays the live-classroom flow against a running server, one simulated classroom per
+class in the database (or --classrooms of them), all in parallel:
+
+  teacher    POST /gamesession/start for every student in the class, then polls
+             GET /gamesession/all-scores every --score-poll seconds until all sessions end
+  Unity      polls GET /gamesession/next?game_id= every --next-poll seconds; for each session
+             POST /gamesession/{id}/start, --score-updates x POST /gamesession/ui-sync,
+             then POST /gamesession/{id}/end
+
+Each classroom plays its own game so the per-game queues do not interfere. Latencies are
+recorded per route template and reported as count, errors, p50/p95/p99 and requests/s.
+
+    python benchmarks/generate_dataset.py --out bench.db
+    DATABASE_URL=sqlite:///./bench.db uvicorn api:app --port 8000
+    python benchmarks/load_test.py --db bench.db --base-url http://127.0.0.1:8000 --json results.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return samples[min(len(samples) - 1, max(0, int(round(q / 100 * len(samples))) - 1))]
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    async def request(self, client: httpx.AsyncClient, method: str, route: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[route] = self.errors.get(route, 0) + 1
+            return None
+        self.samples.setdefault(route, []).append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[route] = self.errors.get(route, 0) + 1
+            return None
+        return response.json()
+
+    def report(self, elapsed: float) -> dict:
+        report = {}
+        for route in sorted(set(self.samples) | set(self.errors)):
+            samples = sorted(self.samples.get(route, []))
+            entry = {"count": len(samples), "errors": self.errors.get(route, 0),
+                     "throughput": round(len(samples) / elapsed, 2) if elapsed else 0.0}
+            if samples:
+                for q in (50, 95, 99):
+                    entry[f"p{q}_ms"] = round(percentile(samples, q) * 1000, 2)
+            report[route] = entry
+        return report
+
+
+def load_classrooms(db_path: str, limit: int) -> list:
+    """(teacher user_id, [student ids]) per class, from a database built by generate_dataset.py."""
+    conn = sqlite3.connect(db_path)
+    classes = conn.execute("SELECT class_id, teacher_id FROM Classes ORDER BY class_id").fetchall()
+    classrooms = []
+    for class_id, teacher_id in classes[:limit or None]:
+        students = [row[0] for row in conn.execute(
+            "SELECT student_internal_id FROM Students WHERE class_id = ? ORDER BY student_internal_id", (class_id,)
+        )]
+        if students:
+            classrooms.append((teacher_id, students))
+    game_ids = [row[0] for row in conn.execute("SELECT game_id FROM Games ORDER BY game_id")]
+    conn.close()
+    return classrooms, game_ids
+
+
+async def run_classroom(client, recorder: LatencyRecorder, args, teacher_id: int, students: list, game_id: int,
+                        rng: random.Random):
+    for student_id in students:
+        await recorder.request(client, "POST", "/gamesession/start", "/gamesession/start",
+                               json={"student_id": student_id, "game_id": game_id, "user_id": teacher_id})
+
+    remaining = set(students)
+    done = asyncio.Event()
+    student_param = ",".join(map(str, students))
+
+    async def teacher():
+        while not done.is_set():
+            await recorder.request(client, "GET", "/gamesession/all-scores", "/gamesession/all-scores",
+                                   params={"game_id": game_id, "student_ids": student_param})
+            try:
+                await asyncio.wait_for(done.wait(), args.score_poll)
+            except asyncio.TimeoutError:
+                pass
+
+    async def unity():
+        idle_polls = 0
+        while remaining and idle_polls < args.max_idle_polls:
+            session = await recorder.request(client, "GET", "/gamesession/next", "/gamesession/next",
+                                             params={"game_id": game_id})
+            if not session:
+                idle_polls += 1
+                await asyncio.sleep(args.next_poll)
+                continue
+            idle_polls = 0
+            session_id, student_id = session["session_id"], session["student_id"]
+            await recorder.request(client, "POST", "/gamesession/{session_id}/start",
+                                   f"/gamesession/{session_id}/start")
+            score = 0
+            for _ in range(args.score_updates):
+                await asyncio.sleep(args.play_time / max(args.score_updates, 1))
+                score = min(100, score + rng.randint(5, 30))
+                await recorder.request(client, "POST", "/gamesession/ui-sync", "/gamesession/ui-sync",
+                                       json={"student_id": student_id, "session_id": session_id,
+                                             "completed": False, "score": score})
+            await recorder.request(client, "POST", "/gamesession/{session_id}/end", f"/gamesession/{session_id}/end",
+                                   json={"result_score": score, "game_id": game_id})
+            remaining.discard(student_id)
+        done.set()
+
+    await asyncio.gather(teacher(), unity())
+
+
+async def run(args) -> dict:
+    classrooms, game_ids = load_classrooms(args.db, args.classrooms)
+    if len(game_ids) < len(classrooms):
+        sys.exit(f"Need at least one game per classroom ({len(classrooms)}), found {len(game_ids)}")
+
+    recorder = LatencyRecorder()
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.connections, max_keepalive_connections=args.connections)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            run_classroom(client, recorder, args, teacher_id, students, game_id, random.Random(rng.random()))
+            for (teacher_id, students), game_id in zip(classrooms, game_ids)
+        ))
+        elapsed = time.perf_counter() - started
+
+    total = sum(len(s) for s in recorder.samples.values())
+    return {
+        "classrooms": len(classrooms),
+        "students": sum(len(students) for _, students in classrooms),
+        "elapsed_s": round(elapsed, 2),
+        "requests": total,
+        "throughput": round(total / elapsed, 2) if elapsed else 0.0,
+        "routes": recorder.report(elapsed),
+    }
+
+
+def print_report(results: dict):
+    print(f"{results['classrooms']} classrooms, {results['students']} students, {results['requests']} requests "
+          f"in {results['elapsed_s']}s ({results['throughput']} req/s)")
+    print(f"{'route':<34} {'count':>7} {'errors':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for route, entry in results["routes"].items():
+        print(f"{route:<34} {entry['count']:>7} {entry['errors']:>6} {entry['throughput']:>8} "
+              f"{entry.get('p50_ms', '-'):>8} {entry.get('p95_ms', '-'):>8} {entry.get('p99_ms', '-'):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", required=True, help="SQLite file the server runs on (read for classes and students)")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--classrooms", type=int, default=0, help="limit the number of classrooms (0 = all)")
+    parser.add_argument("--play-time", type=float, default=2.0, help="seconds each student plays")
+    parser.add_argument("--score-updates", type=int, default=3, help="ui-sync score updates per game")
+    parser.add_argument("--next-poll", type=float, default=0.5, help="Unity /gamesession/next poll interval")
+    parser.add_argument("--score-poll", type=float, default=1.0, help="teacher /gamesession/all-scores poll interval")
+    parser.add_argument("--max-idle-polls", type=int, default=20, help="give up after this many empty next polls")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
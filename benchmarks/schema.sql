@@ -0,0 +1,81 @@
+-- KineDB schema used by the benchmark dataset generator. Mirrors the tables and columns
+-- api.py reflects at startup (see the Pydantic models there); keep the two in sync.
+CREATE TABLE Users (user_id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT, email TEXT, password TEXT, role TEXT, first_name TEXT, last_name TEXT, status TEXT, profile_image TEXT, school_id INTEGER);
+
+CREATE TABLE Subjects (subject_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, description TEXT, grade_level TEXT, curriculum_area TEXT, icon TEXT);
+
+CREATE TABLE Skills (skill_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, description TEXT, subject_id INTEGER, level TEXT, prerequisite_skill_id INTEGER, taxonomy TEXT);
+
+CREATE TABLE Schools (school_id INTEGER PRIMARY KEY AUTOINCREMENT, school_name TEXT, city TEXT, state TEXT, status TEXT);
+
+CREATE TABLE Teachers (teacher_id TEXT PRIMARY KEY, first_name TEXT, last_name TEXT, email TEXT, status TEXT, school_id INTEGER, user_id INTEGER);
+
+CREATE TABLE Classes (class_id INTEGER PRIMARY KEY AUTOINCREMENT, class_name TEXT, grade_level TEXT, description TEXT, schedule TEXT, location TEXT, status TEXT, teacher_id INTEGER, school_id INTEGER, last_active DATETIME, students INTEGER);
+
+CREATE TABLE ClassRecentGames (id INTEGER PRIMARY KEY AUTOINCREMENT, class_id INTEGER, game_name TEXT, game_date DATETIME, avg_score REAL);
+
+CREATE TABLE Students (student_internal_id INTEGER PRIMARY KEY, student_external_id TEXT, name TEXT, email TEXT, grade TEXT, avatar TEXT, status TEXT, join_date DATETIME, avg_score NUMERIC, avg_time_per_session TEXT, last_active DATETIME, phone TEXT, progress_status TEXT, class_id INTEGER, games_played INTEGER, user_id INTEGER, school_id INTEGER, notes TEXT, parent_name TEXT, parent_email TEXT, parent_phone TEXT, address TEXT, teacher TEXT);
+
+CREATE TABLE Strengths (strength_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, description TEXT, category TEXT);
+
+CREATE TABLE DevelopmentAreas (area_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, description TEXT, category TEXT);
+
+CREATE TABLE StudentStrengths (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, strength_id INTEGER, level INTEGER, notes TEXT);
+
+CREATE TABLE StudentDevelopmentAreas (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, area_id INTEGER, priority INTEGER, notes TEXT, improvement_plan TEXT);
+
+CREATE TABLE Games (game_id INTEGER PRIMARY KEY AUTOINCREMENT, game_name TEXT, subject TEXT, level TEXT, description TEXT, status TEXT, creator TEXT, last_updated DATETIME, plays INTEGER, avg_score REAL, avg_time TEXT, difficulty_level INTEGER, age_range TEXT, thumbnail_url TEXT, time_limit INTEGER, points_per_question INTEGER);
+
+CREATE TABLE GameSkills (id INTEGER PRIMARY KEY AUTOINCREMENT, game_id INTEGER, skill TEXT);
+
+CREATE TABLE GameTargetSkills (id INTEGER PRIMARY KEY AUTOINCREMENT, game_id INTEGER, skill_id INTEGER, primary_focus BOOLEAN, weight INTEGER);
+
+CREATE TABLE GameTargetSubjects (id INTEGER PRIMARY KEY AUTOINCREMENT, game_id INTEGER, subject_id INTEGER, primary_focus BOOLEAN, weight INTEGER);
+
+CREATE TABLE ShortTermGoals (goal_id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, title TEXT, description TEXT, created_date DATETIME, target_date DATETIME, completion_date DATETIME, status TEXT, progress INTEGER, skill_id INTEGER, subject_id INTEGER, notes TEXT, created_by INTEGER);
+
+CREATE TABLE MediumTermGoals (goal_id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, title TEXT, description TEXT, created_date DATETIME, target_date DATETIME, completion_date DATETIME, status TEXT, progress INTEGER, skill_id INTEGER, subject_id INTEGER, notes TEXT, related_short_term_goals TEXT, created_by INTEGER);
+
+CREATE TABLE LongTermGoals (goal_id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, title TEXT, description TEXT, created_date DATETIME, target_date DATETIME, completion_date DATETIME, status TEXT, progress INTEGER, skill_id INTEGER, subject_id INTEGER, notes TEXT, related_medium_term_goals TEXT, created_by INTEGER);
+
+CREATE TABLE StudentRecommendedGames (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, game_id INTEGER, recommendation_date DATETIME, reason TEXT, priority INTEGER, status TEXT, recommended_by INTEGER, target_skill_id INTEGER, target_area_id INTEGER);
+
+CREATE TABLE MonthlyProgress (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, month INTEGER, year INTEGER, overall_score REAL, games_played INTEGER, total_time_spent INTEGER, improvement_percentage REAL, notes TEXT, teacher_feedback TEXT, strengths TEXT, areas_for_improvement TEXT);
+
+CREATE TABLE StudentGamePerformances (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, game_id INTEGER, play_date DATETIME, score REAL, duration INTEGER, completion_status TEXT, difficulty_level INTEGER, mistakes_made INTEGER, hints_used INTEGER, skills_demonstrated TEXT, areas_for_improvement TEXT);
+
+CREATE TABLE StudentBadges (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, badge TEXT);
+
+CREATE TABLE StudentSkills (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, skill TEXT, score INTEGER, is_strength BOOLEAN);
+
+CREATE TABLE StudentSubjectScores (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, subject TEXT, score REAL);
+
+CREATE TABLE GamePlays (id INTEGER PRIMARY KEY AUTOINCREMENT, game_id INTEGER, student_id INTEGER, score REAL, played_at DATETIME, details TEXT);
+
+CREATE TABLE RecentActivities (id INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT, title TEXT, description TEXT, time TEXT);
+
+CREATE TABLE RecentPlayers (id INTEGER PRIMARY KEY AUTOINCREMENT, game_id INTEGER, student_id INTEGER, score REAL, played_at DATETIME);
+
+CREATE TABLE TopPerformers (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, subject TEXT, score REAL);
+
+CREATE TABLE DashboardStats (id INTEGER PRIMARY KEY AUTOINCREMENT, total_students INTEGER, new_students_this_week INTEGER, total_classes INTEGER, active_classes INTEGER, total_games INTEGER, new_games INTEGER, average_score REAL, score_change_percentage REAL, student_count INTEGER, school_count INTEGER, class_count INTEGER, game_count INTEGER, timestamp TEXT);
+
+CREATE TABLE Projects (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, students INTEGER, completion INTEGER, avg_score REAL);
+
+CREATE TABLE GameImpacts (id INTEGER PRIMARY KEY AUTOINCREMENT, game_name TEXT UNIQUE, main_subject TEXT, subjects_boost TEXT, skills_boost TEXT, add_strengths TEXT, add_areas_on_low_score TEXT, recommendations TEXT, difficulty_level TEXT, recomended_age TEXT, time_to_complete TEXT, additional_notes TEXT);
+
+CREATE TABLE PossibleAreas (id TEXT PRIMARY KEY, label TEXT, description TEXT);
+
+CREATE TABLE PossibleStrengths (id TEXT PRIMARY KEY, label TEXT, description TEXT);
+
+CREATE TABLE game_sessions (session_id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, game_id INTEGER, completed INTEGER DEFAULT 0, is_started INTEGER DEFAULT 0, score INTEGER, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME, user_id INTEGER);
+
+CREATE TABLE UISyncStatus (student_id INTEGER PRIMARY KEY, score INTEGER, completed INTEGER, updated_at DATETIME);
+
+CREATE TABLE StudentActionPlans (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, type TEXT, goal TEXT, status TEXT DEFAULT 'pending');
+
+CREATE TABLE performance_scores (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, math_score REAL, english_score REAL, science_score REAL, design_score REAL, education_score REAL, human_score REAL, history_score REAL, art_score REAL, music_score REAL, biology_score REAL, geography_score REAL, engineering_score REAL, algorithm_score REAL, social_score REAL, general_score REAL);
+
+CREATE TABLE SuggestedActionTemplates (id INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT, goal TEXT, condition TEXT, target_condition TEXT);
+
+CREATE TABLE GameSyncSignal (id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER, game_id INTEGER, status TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP);